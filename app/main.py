@@ -1,15 +1,33 @@
 # app/main.py
+import asyncio
+import hashlib
 import os
+import time
 import logging
+from contextlib import asynccontextmanager
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request, Query
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 import httpx
-from starlette.responses import JSONResponse
+import jinja2
+import orjson
+from starlette.background import BackgroundTask
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response, StreamingResponse
+
+# uvloop: libuv 기반 이벤트 루프로 프록시 I/O 오버헤드 절감
+# (Windows 개발환경 등 미설치 환경에서는 기본 asyncio 루프 유지)
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+if uvloop is not None and os.getenv("DEBUG_MODE") != "1":
+    uvloop.install()
 
 # ----------------------------
 # 환경설정
@@ -19,36 +37,57 @@ API_KEY = os.getenv("API_KEY", "")  # 필요 없다면 빈 값 유지
 
 # 임시(외부) 데이터 서버
 UPSTREAM_API_BASE = os.getenv("UPSTREAM_API_BASE", "https://shuttle-roid-894717980119.asia-northeast3.run.app/")
-UPSTREAM_API_BASE2 = os.getenv("UPSTREAM_API_BASE", "http://zxcv.imagine.io.kr:9900")
+UPSTREAM_API_BASE2 = os.getenv("UPSTREAM_API_BASE2", "http://zxcv.imagine.io.kr:9900")
 TIMEOUT = float(os.getenv("UPSTREAM_TIMEOUT", "3.0"))
 
-app = FastAPI(title="ShuttlePassengerClient")
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
-templates = Jinja2Templates(directory="app/templates")
+# httpx AsyncClient 수명주기 관리 (lifespan: app.state.http 로 접근)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 프록시는 항상 전체 URL 로 호출하므로 base_url 은 두지 않는다.
+    # keepalive 풀을 넉넉히 잡아 업스트림 TLS/핸드셰이크 비용을 핫패스에서 제거.
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(TIMEOUT, connect=2.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            retries=1,
+        ),
+        headers={"Authorization": f"Bearer {API_KEY}"} if API_KEY else None,
+    )
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
 
-# httpx AsyncClient 수명주기 관리
-client: Optional[httpx.AsyncClient] = None
 
-# log library
-logger = logging.getLogger("uvicorn.error")
+app = FastAPI(title="ShuttlePassengerClient", default_response_class=ORJSONResponse, lifespan=lifespan)
 
+# JSON 배열 응답(/stops, /routes-data, /orgs-data 등) 압축 전송.
+# 작은 응답은 압축 오버헤드가 더 크므로 512바이트 이상만.
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
-@app.on_event("startup")
-async def _startup() -> None:
-    global client
-    client = httpx.AsyncClient(
-        base_url=API_BASE_URL,
-        timeout=httpx.Timeout(10.0, connect=5.0),
-        headers={"Authorization": f"Bearer {API_KEY}"} if API_KEY else None,
-    )
+# 정적 파일: 운영(ENV=prod)에서는 전면의 nginx 가 /static 을 직접 서빙한다
+# (deploy/nginx.conf 참고). 그 외 환경에서는 앱이 직접 서빙.
+# StaticFiles 는 ETag/Last-Modified 를 자동으로 붙여 304 재검증을 지원한다.
+if os.getenv("ENV", "dev") != "prod":
+    app.mount("/static", StaticFiles(directory="app/static"), name="static")
+templates = Jinja2Templates(directory="app/templates")
 
+# 템플릿 셋은 기동 시점에 고정이므로 리로드/로더 재탐색을 끄고
+# 미리 컴파일해 둔 Template 객체로 바로 렌더링한다.
+templates.env.auto_reload = False
+templates.env.cache_size = 400
+templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache()
+HOME_TMPL = templates.env.get_template("home.html")
+ROUTE_LIST_TMPL = templates.env.get_template("route_list.html")
+ROUTE_DETAIL_TMPL = templates.env.get_template("route_detail.html")
 
-@app.on_event("shutdown")
-async def _shutdown() -> None:
-    global client
-    if client:
-        await client.aclose()
-        client = None
+# log library
+logger = logging.getLogger("uvicorn.error")
 
 
 # ----------------------------
@@ -59,37 +98,32 @@ async def _shutdown() -> None:
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request) -> HTMLResponse:
     # orgs는 이후 필요시 프록시 + 클라렌더 방식으로 확장 가능
-    return templates.TemplateResponse("home.html", {"request": request})
+    return HTMLResponse(HOME_TMPL.render(request=request))
 
 
 # (2) 기관 내 노선 목록 페이지(HTML)
 #    실제 데이터는 /routes-data 프록시를 통해 클라이언트 JS가 주입한다.
 @app.get("/routes", response_class=HTMLResponse)
 async def routes(request: Request, orgId: str = Query(...)) -> HTMLResponse:
-    return templates.TemplateResponse(
-        "route_list.html",
-        {
-            "request": request,
-            "orgId": orgId,
-        },
-    )
+    return HTMLResponse(ROUTE_LIST_TMPL.render(request=request, orgId=orgId))
 
 
 # (3) 노선 상세(정류소 목록) 페이지(HTML)
-@app.get("/{org}/{routeNo}", response_class=HTMLResponse)
+#    명시적 /detail 프리픽스를 써서 /meta, /stops 등 리터럴 경로가
+#    2-세그먼트 캐치올 패턴 매칭을 거치지 않게 한다.
+@app.get("/detail/{org}/{routeNo}", response_class=HTMLResponse)
 async def route_detail(request: Request, org: str, routeNo: str) -> HTMLResponse:
     """
     HTML만 SSR. org/routeNo를 템플릿에 주입하여
     클라이언트 JS가 /meta, /stops, /vehicles 프록시를 호출하도록 한다.
     """
-    return templates.TemplateResponse(
-        "route_detail.html",
-        {
-            "request": request,
-            "orgId": org,
-            "routeId": routeNo,
-            "apiBase": "",  # 동일 오리진 프록시 사용
-        },
+    return HTMLResponse(
+        ROUTE_DETAIL_TMPL.render(
+            request=request,
+            orgId=org,
+            routeId=routeNo,
+            apiBase="",  # 동일 오리진 프록시 사용
+        )
     )
 
 
@@ -102,101 +136,359 @@ def _ensure_params(orgId: Optional[str], routeId: Optional[str]) -> None:
         raise HTTPException(status_code=400, detail="orgId and routeId are required.")
 
 
-# (A) 노선 메타
-@app.get("/meta")
-async def meta_proxy(orgId: str = Query(...), routeId: str = Query(...)):
-    url = f"{UPSTREAM_API_BASE}/user/meta" if orgId == "1" else f"{UPSTREAM_API_BASE2}/meta"
-    logger.info(f"[proxy] -> GET {url} params={{'orgID': '{orgId}', 'routeID': '{routeId}'}}")
+# 동시 동일 요청 병합(singleflight):
+# 같은 (엔드포인트, orgId, routeId) 업스트림 호출이 동시에 N건 들어오면
+# 실제 업스트림 GET은 1건만 나가고 나머지는 그 결과를 공유한다.
+INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+# 준정적 응답용 인프로세스 TTL 캐시.
+# 기관/노선/정류소 목록은 분~시간 단위로만 바뀌므로 짧게 캐시하고
+# Cache-Control 로 브라우저/중간 프록시 재사용도 허용한다.
+# (/vehicles 는 실시간이므로 캐시하지 않음)
+CACHE_TTL = float(os.getenv("PROXY_CACHE_TTL", "60"))
+CACHE_MAX = int(os.getenv("PROXY_CACHE_MAX", "1024"))
+CACHE: Dict[tuple, tuple] = {}
+CACHE_HEADERS = {"Cache-Control": f"public, max-age={int(CACHE_TTL)}"}
+
+# 조건부 GET 용 ETag. 프록시가 들고 있는 본문에서 직접 계산해
+# If-None-Match 폴링이 304(빈 본문)로 끝나게 한다.
+ETAGS: Dict[tuple, str] = {}
+
+
+def _etag_for(body: bytes) -> str:
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _cache_get(key: tuple) -> Optional[Any]:
+    hit = CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _cache_put(key: tuple, body: bytes) -> None:
+    # 키는 클라이언트 입력(orgId, q 등)에서 오므로 무한정 쌓일 수 있다.
+    # 상한 도달 시 만료 항목부터 비우고, 그래도 차 있으면 오래된 키부터 제거.
+    if key not in CACHE and len(CACHE) >= CACHE_MAX:
+        now = time.monotonic()
+        for k in [k for k, (ts, _) in CACHE.items() if now - ts >= CACHE_TTL]:
+            CACHE.pop(k, None)
+            ETAGS.pop(k, None)
+        while len(CACHE) >= CACHE_MAX:
+            k = next(iter(CACHE))  # dict 삽입 순서 = 가장 오래된 키
+            CACHE.pop(k, None)
+            ETAGS.pop(k, None)
+    CACHE[key] = (time.monotonic(), body)
+    ETAGS[key] = _etag_for(body)
+
+
+async def _singleflight(key: tuple, coro_factory) -> Any:
+    if key in INFLIGHT:
+        # shield: 대기자 하나가 취소돼도 공유 future 까지 취소돼
+        # 나머지 대기자들이 CancelledError 를 받는 일이 없게 한다.
+        return await asyncio.shield(INFLIGHT[key])
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    INFLIGHT[key] = fut
     try:
-        assert client is not None, "HTTP client is not initialized"
-        r = await client.get(url, params={"orgID": orgId, "routeID": routeId}, timeout=TIMEOUT)
-        logger.info(f"[proxy] <- {r.status_code} from {url}")
+        result = await coro_factory()
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        INFLIGHT.pop(key, None)
+
+
+async def _fetch_bytes(http: httpx.AsyncClient, url: httpx.URL, params: Dict[str, Any]) -> bytes:
+    """업스트림 JSON 을 파싱하지 않고 원본 바이트 그대로 받아온다.
+
+    파싱(json.loads) + 재직렬화(json.dumps)를 건너뛰어 프록시 구간의
+    CPU/할당 비용을 절반 수준으로 줄인다. 언랩이 필요한 경우에만
+    호출부에서 파싱한다.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[proxy] -> GET %s params=%s", url, params)
+    r = await http.send(http.build_request("GET", url.copy_merge_params(params), timeout=TIMEOUT))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[proxy] <- %s from %s", r.status_code, url)
+    r.raise_for_status()
+    return r.content
+
+
+def _json_bytes(data: Any) -> bytes:
+    # orjson: 컴팩트 UTF-8 직렬화 (stdlib json 대비 수 배 빠름)
+    return orjson.dumps(data)
+
+
+# 엔드포인트별 업스트림 URL 테이블: (기타 기관, orgId == "1")
+# httpx.URL 로 미리 파싱해 두고 요청 시에는 쿼리만 병합한다
+# (요청당 f-string 결합/URL 문자열 파싱 제거).
+PROXY_URLS: Dict[str, tuple] = {
+    "meta": (httpx.URL(f"{UPSTREAM_API_BASE2}/meta"), httpx.URL(f"{UPSTREAM_API_BASE}/user/meta")),
+    "stops": (httpx.URL(f"{UPSTREAM_API_BASE2}/stops"), httpx.URL(f"{UPSTREAM_API_BASE}/user/stops")),
+    "vehicles": (httpx.URL(f"{UPSTREAM_API_BASE2}/vehicles"), httpx.URL(f"{UPSTREAM_API_BASE}/user/vehicles")),
+    "routes-data": (httpx.URL(f"{UPSTREAM_API_BASE2}/routes"), httpx.URL(f"{UPSTREAM_API_BASE}/user/route-list")),
+}
+ORGS_DATA_URL = httpx.URL(f"{UPSTREAM_API_BASE2}/user/orgs")
+
+NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+
+def _upstream_url(kind: str, orgId: str) -> httpx.URL:
+    return PROXY_URLS[kind][orgId == "1"]
+
+
+async def _proxy_bytes(
+    http: httpx.AsyncClient,
+    key: tuple,
+    url: httpx.URL,
+    params: Dict[str, Any],
+    *,
+    cacheable: bool = True,
+    unwrap: Optional[str] = None,
+) -> bytes:
+    """공통 프록시 본문: TTL 캐시 → singleflight → 업스트림 GET → 바이트.
+
+    unwrap 이 지정되면 {unwrap: [...]} 형태의 업스트림 응답을 배열로 풀고,
+    배열이 바로 오면 파싱 없이 통과시킨다.
+    """
+    if cacheable:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+    body = await _singleflight(key, lambda: _fetch_bytes(http, url, params))
+    if unwrap and body[:1] != b"[":
+        data = orjson.loads(body)
+        if isinstance(data, dict) and unwrap in data:
+            data = data[unwrap]
+        if not isinstance(data, list):
+            raise HTTPException(status_code=502, detail=f"Invalid {unwrap} payload from upstream")
+        body = _json_bytes(data)
+    if cacheable:
+        _cache_put(key, body)
+    return body
+
+
+async def _proxy(
+    http: httpx.AsyncClient,
+    key: tuple,
+    url: httpx.URL,
+    params: Dict[str, Any],
+    *,
+    cacheable: bool = True,
+    unwrap: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """if_none_match: None 이면 조건부 GET 비활성. 활성 엔드포인트는
+    클라이언트의 If-None-Match 헤더 값(없으면 "")을 넘긴다."""
+    headers = CACHE_HEADERS if cacheable else NO_STORE_HEADERS
+    conditional = if_none_match is not None
+    # 언랩이 필요한 엔드포인트는 어차피 전체 파싱이 필요하므로 버퍼링 경로 유지.
+    # singleflight 후발 주자도 선발 주자가 모은 전체 바이트를 그대로 받는다.
+    # If-None-Match 를 들고 온 요청도 버퍼링 경로로: 스트리밍은 본문을 다 보낸
+    # 뒤에야 ETag 를 알 수 있어 304 비교가 불가능하다 (TTL 밖 폴링 대응).
+    if unwrap is not None or if_none_match or key in INFLIGHT or (cacheable and _cache_get(key) is not None):
+        try:
+            body = await _proxy_bytes(http, key, url, params, cacheable=cacheable, unwrap=unwrap)
+            etag = ETAGS.get(key) if conditional else None
+            if etag:
+                headers = {**headers, "ETag": etag}
+                if if_none_match == etag:
+                    return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+        except httpx.HTTPError as e:
+            logger.exception("[proxy] upstream error: %s", e)
+            raise HTTPException(status_code=502, detail=f"upstream error: {e}")
+
+    # 선발 주자: 업스트림 본문을 버퍼링 없이 그대로 중계해 TTFB/메모리 피크를
+    # 줄이고, 수신한 청크를 모아 완료 시점에 캐시와 대기자 future 에 공급한다.
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    INFLIGHT[key] = fut
+
+    def _fail(e: BaseException) -> None:
+        INFLIGHT.pop(key, None)
+        if not fut.done():
+            err = e if isinstance(e, httpx.HTTPError) else httpx.TransportError(f"upstream relay aborted: {e!r}")
+            fut.set_exception(err)
+            fut.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+
+    r: Optional[httpx.Response] = None
+    try:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[proxy] -> GET %s params=%s (stream)", url, params)
+        r = await http.send(
+            http.build_request("GET", url.copy_merge_params(params), timeout=TIMEOUT),
+            stream=True,
+        )
         r.raise_for_status()
-        return JSONResponse(r.json(), headers={"Cache-Control": "no-store"})
     except httpx.HTTPError as e:
-        logger.exception(f"[proxy] upstream error: {e}")
+        if r is not None:
+            await r.aclose()
+        _fail(e)
+        logger.exception("[proxy] upstream error: %s", e)
         raise HTTPException(status_code=502, detail=f"upstream error: {e}")
+    except BaseException as e:
+        # 핸들러 태스크 취소(CancelledError) 등 — 선발 주자는 어떤 경로로든
+        # 자기 future 를 정리하고 나가야 후속 요청이 영원히 대기하지 않는다.
+        if r is not None:
+            await r.aclose()
+        _fail(e)
+        raise
+
+    # 업스트림이 검증자를 주면 그대로 전달하고 프록시 ETag 로도 채택한다.
+    # (없으면 완료 시점에 본문 해시로 ETag 를 만들어 다음 폴링부터 304 처리)
+    upstream_etag = r.headers.get("etag") if conditional else None
+    if conditional:
+        extra = {h: r.headers[h] for h in ("etag", "last-modified") if h in r.headers}
+        if extra:
+            headers = {**headers, **extra}
+
+    async def relay():
+        chunks = []
+        try:
+            # aiter_raw 가 아니라 aiter_bytes: 업스트림이 gzip 등으로 압축해 보내도
+            # 디코딩된 평문 JSON 을 중계/캐시한다 (_fetch_bytes 의 r.content 와 동일 규칙).
+            async for chunk in r.aiter_bytes():
+                chunks.append(chunk)
+                yield chunk
+        except BaseException as e:
+            _fail(e)
+            raise
+        else:
+            body = b"".join(chunks)
+            if cacheable:
+                _cache_put(key, body)
+                if upstream_etag:
+                    ETAGS[key] = upstream_etag
+            if not fut.done():
+                fut.set_result(body)
+        finally:
+            # 중간 실패(읽기 오류/타임아웃) 시 BackgroundTask 는 실행되지 않으므로
+            # 제너레이터 자체에서 정리를 보장한다.
+            INFLIGHT.pop(key, None)
+            if not fut.done():
+                fut.set_exception(httpx.TransportError("upstream relay aborted"))
+                fut.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+            await r.aclose()
+
+    async def _finalize() -> None:
+        # 본문 제너레이터가 한 번도 돌지 못한 경우(스트리밍 시작 전 클라이언트
+        # 이탈)의 안전망. relay 의 finally 와 중복 실행돼도 무해(멱등)하다.
+        await r.aclose()
+        INFLIGHT.pop(key, None)
+        if not fut.done():
+            fut.set_exception(httpx.TransportError("upstream relay aborted"))
+            fut.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+
+    return StreamingResponse(
+        relay(),
+        media_type="application/json",
+        headers=headers,
+        background=BackgroundTask(_finalize),
+    )
 
 
-# (B) 정류소 목록
+# (A) 노선 메타
+@app.get("/meta")
+async def meta_proxy(request: Request, orgId: str = Query(...), routeId: str = Query(...)):
+    return await _proxy(
+        request.app.state.http,
+        ("meta", orgId, routeId),
+        _upstream_url("meta", orgId),
+        {"orgID": orgId, "routeID": routeId},
+    )
+
+
+# (B) 정류소 목록 (준정적: 조건부 GET 지원)
 @app.get("/stops")
-async def stops_proxy(orgId: str = Query(...), routeId: str = Query(...)):
-    url = f"{UPSTREAM_API_BASE}/user/stops" if orgId == "1" else f"{UPSTREAM_API_BASE2}/stops"
-    try:
-        assert client is not None, "HTTP client is not initialized"
-        r = await client.get(url, params={"orgID": orgId, "routeID": routeId}, timeout=TIMEOUT)
-        r.raise_for_status()
-        return JSONResponse(r.json(), headers={"Cache-Control": "no-store"})
-    except httpx.HTTPError as e:
-        raise HTTPException(status_code=502, detail=f"upstream error: {e}")
+async def stops_proxy(request: Request, orgId: str = Query(...), routeId: str = Query(...)):
+    return await _proxy(
+        request.app.state.http,
+        ("stops", orgId, routeId),
+        _upstream_url("stops", orgId),
+        {"orgID": orgId, "routeID": routeId},
+        if_none_match=request.headers.get("if-none-match", ""),
+    )
 
 
-# (C) 차량 목록
+# (C) 차량 목록 (실시간: 캐시 제외)
 @app.get("/vehicles")
-async def vehicles_proxy(orgId: str = Query(...), routeId: str = Query(...)):
-    url = f"{UPSTREAM_API_BASE}/user/vehicles" if orgId == "1" else f"{UPSTREAM_API_BASE2}/vehicles"
-    try:
-        assert client is not None, "HTTP client is not initialized"
-        r = await client.get(url, params={"orgID": orgId, "routeID": routeId}, timeout=TIMEOUT)
-        r.raise_for_status()
-        return JSONResponse(r.json(), headers={"Cache-Control": "no-store"})
-    except httpx.HTTPError as e:
-        raise HTTPException(status_code=502, detail=f"upstream error: {e}")
+async def vehicles_proxy(request: Request, orgId: str = Query(...), routeId: str = Query(...)):
+    return await _proxy(
+        request.app.state.http,
+        ("vehicles", orgId, routeId),
+        _upstream_url("vehicles", orgId),
+        {"orgID": orgId, "routeID": routeId},
+        cacheable=False,
+    )
+
+
+# (C') 메타+정류소+차량 묶음  ← 노선 상세 페이지 초기 로드용
+#      업스트림 3건을 병렬 호출해 브라우저-서버 왕복을 1회로 줄인다.
+#      일부 실패는 해당 키에 {"error": ...} 로 담아 부분 응답을 허용.
+@app.get("/bundle")
+async def bundle_proxy(request: Request, orgId: str = Query(...), routeId: str = Query(...)):
+    http = request.app.state.http
+    params = {"orgID": orgId, "routeID": routeId}
+    results = await asyncio.gather(
+        _proxy_bytes(http, ("meta", orgId, routeId), _upstream_url("meta", orgId), params),
+        _proxy_bytes(http, ("stops", orgId, routeId), _upstream_url("stops", orgId), params),
+        _proxy_bytes(
+            http,
+            ("vehicles", orgId, routeId),
+            _upstream_url("vehicles", orgId),
+            params,
+            cacheable=False,
+        ),
+        return_exceptions=True,
+    )
+    parts = []
+    for name, res in zip((b'"meta":', b'"stops":', b'"vehicles":'), results):
+        if isinstance(res, BaseException):
+            logger.warning("[proxy] bundle upstream error: %s", res)
+            res = _json_bytes({"error": str(res)})
+        parts.append(name + res)
+    body = b"{" + b",".join(parts) + b"}"
+    return Response(content=body, media_type="application/json", headers=NO_STORE_HEADERS)
 
 
 # (D) 노선 목록  ← [신규] /routes 페이지용 프록시
 #     외부 서버 규약: GET /routes?orgId=...
 @app.get("/routes-data")
-async def routes_data_proxy(orgId: str = Query(...)):
-    url = f"{UPSTREAM_API_BASE}/user/route-list" if orgId == "1" else f"{UPSTREAM_API_BASE2}/routes"
-    logger.info(f"[proxy] -> GET {url} params={{'orgID': '{orgId}'}}")
-    try:
-        assert client is not None, "HTTP client is not initialized"
-        r = await client.get(url, params={"orgID": orgId}, timeout=TIMEOUT)
-        logger.info(f"[proxy] <- {r.status_code} from {url}")
-        r.raise_for_status()
-        # 외부가 배열 혹은 {routes:[...]} 모두 수용
-        data = r.json()
-        if isinstance(data, dict) and "routes" in data:
-            data = data["routes"]
-        if not isinstance(data, list):
-            raise HTTPException(status_code=502, detail="Invalid routes payload from upstream")
-        return JSONResponse(data, headers={"Cache-Control": "no-store"})
-    except httpx.HTTPError as e:
-        logger.exception(f"[proxy] upstream error: {e}")
-        raise HTTPException(status_code=502, detail=f"upstream error: {e}")
+async def routes_data_proxy(request: Request, orgId: str = Query(...)):
+    return await _proxy(
+        request.app.state.http,
+        ("routes-data", orgId),
+        _upstream_url("routes-data", orgId),
+        {"orgID": orgId},
+        unwrap="routes",
+        if_none_match=request.headers.get("if-none-match", ""),
+    )
 
 
 # (E) 기관 목록  ← [신규] / 루트(기관 선택) 페이지용 프록시
 #     외부 서버 규약: GET /orgs  (옵션: ?q=검색어 등)
 @app.get("/orgs-data")
-async def orgs_data_proxy(q: Optional[str] = Query(None)):
-    url = f"{UPSTREAM_API_BASE2}/user/orgs"
+async def orgs_data_proxy(request: Request, q: Optional[str] = Query(None)):
     params: Dict[str, Any] = {}
     if q:
         params["q"] = q
-
-    logger.info(f"[proxy] -> GET {url} params={params or '{}'}")
-    try:
-        assert client is not None, "HTTP client is not initialized"
-        r = await client.get(url, params=params, timeout=TIMEOUT)
-        logger.info(f"[proxy] <- {r.status_code} from {url}")
-        r.raise_for_status()
-
-        # 외부가 배열 또는 {orgs:[...]} 모두 수용
-        data = r.json()
-        if isinstance(data, dict) and "orgs" in data:
-            data = data["orgs"]
-        if not isinstance(data, list):
-            raise HTTPException(status_code=502, detail="Invalid orgs payload from upstream")
-
-        # 그대로 프런트로 전달 (home.html의 JS가 렌더링)
-        return JSONResponse(data, headers={"Cache-Control": "no-store"})
-    except httpx.HTTPError as e:
-        logger.exception(f"[proxy] upstream error: {e}")
-        raise HTTPException(status_code=502, detail=f"upstream error: {e}")
+    return await _proxy(request.app.state.http, ("orgs-data", q), ORGS_DATA_URL, params, unwrap="orgs")
 
 # ----------------------------
-# 개발 실행 안내 (uvicorn)
+# 실행 안내 (uvicorn)
 # ----------------------------
-# uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+# 개발:
+#   uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+#
+# 운영: 워커를 코어 수만큼 띄우고 C 구현 HTTP 파서/이벤트 루프 사용.
+# (TTL 캐시/singleflight 는 워커별로 독립 동작 — 업스트림 호출이
+#  워커 수만큼 늘 수 있지만 TTL 내 재사용은 그대로 유효)
+#   uvicorn app.main:app --workers $(nproc) --loop uvloop --http httptools \
+#       --host 0.0.0.0 --port 8000 --proxy-headers
+# 또는 gunicorn 조합:
+#   gunicorn app.main:app -k uvicorn.workers.UvicornWorker -w $(nproc) \
+#       -b 0.0.0.0:8000